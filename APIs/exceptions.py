@@ -0,0 +1,32 @@
+import logging
+from django.conf import settings
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import exception_handler
+from django.core.exceptions import ObjectDoesNotExist
+
+
+logger = logging.getLogger(__name__)
+
+
+def api_exception_handler(exc, context):
+    response = exception_handler(exc, context)
+    if response is not None:
+        return response
+
+    if isinstance(exc, ObjectDoesNotExist):
+        return Response({"error": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+    if isinstance(exc, ValueError):
+        logger.warning("Invalid value in %s", context["request"].path, exc_info=exc)
+        return Response(
+            {"error": "Invalid request data."}, status=status.HTTP_400_BAD_REQUEST
+        )
+
+    if settings.DEBUG:
+        # Let Django render its debug page and log the traceback itself.
+        return None
+    logger.exception("Unhandled error in %s", context["request"].path, exc_info=exc)
+    return Response(
+        {"error": "An unexpected error occurred."},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
@@ -0,0 +1,10 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    # OWASP's Argon2id baseline: 19 MiB, 2 passes, 1 lane. Django's stock
+    # parameters (100 MiB, 8 lanes) make every login and password set several
+    # times more expensive on a small API server.
+    time_cost = 2
+    memory_cost = 19456
+    parallelism = 1
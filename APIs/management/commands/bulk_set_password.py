@@ -0,0 +1,59 @@
+import os
+from getpass import getpass
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.management.base import BaseCommand, CommandError
+
+
+PASSWORD_ENV_VAR = "DJANGO_BULK_SET_PASSWORD"
+
+
+class Command(BaseCommand):
+    help = "Set the same password for several users with a single hash and UPDATE."
+
+    def add_arguments(self, parser):
+        parser.add_argument("user_ids", nargs="+", type=int)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Allow running when DEBUG is off.",
+        )
+
+    def handle(self, *args, **options):
+        if not settings.DEBUG and not options["force"]:
+            raise CommandError(
+                "Refusing to run with DEBUG off; pass --force to override."
+            )
+
+        # Like createsuperuser, read the password from the environment so it
+        # never appears in the process list or shell history.
+        password = os.environ.get(PASSWORD_ENV_VAR) or getpass("New password: ")
+        if not password:
+            raise CommandError("Password cannot be empty.")
+
+        user_ids = set(options["user_ids"])
+        users = list(User.objects.filter(id__in=user_ids))
+        missing = sorted(user_ids - {user.id for user in users})
+        if missing:
+            self.stderr.write(
+                f"No user found for id(s): {', '.join(map(str, missing))}"
+            )
+        if not users:
+            raise CommandError("No matching users.")
+
+        try:
+            for user in users:
+                validate_password(password, user)
+        except ValidationError as e:
+            raise CommandError(" ".join(e.messages)) from e
+
+        hashed = make_password(password)
+        updated = User.objects.filter(id__in=[user.id for user in users]).update(
+            password=hashed
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated password for {updated} user(s).")
+        )
@@ -0,0 +1,21 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class ORJSONRenderer(JSONRenderer):
+    encoder = JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # DRF's ListField/DictField errors use int keys, which json.dumps
+        # stringifies and orjson rejects unless OPT_NON_STR_KEYS is set.
+        option = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+        # orjson only supports two-space indentation; any requested indent
+        # (e.g. the browsable API's 4) gets pretty-printed output.
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            option |= orjson.OPT_INDENT_2
+        # Types orjson does not know (Decimal, lazy strings, ...) fall back
+        # to DRF's encoder so responses match JSONRenderer.
+        return orjson.dumps(data, default=self.encoder.default, option=option)
@@ -1,7 +1,11 @@
+import logging
 from rest_framework import serializers
 from django.contrib.auth.models import User
 
 
+logger = logging.getLogger(__name__)
+
+
 class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -14,10 +18,10 @@ class UserSerializer(serializers.ModelSerializer):
             "is_active",
             "is_staff",
         ]
-        # extra_kwargs = {"password": {"write_only": True}}
+        extra_kwargs = {"password": {"write_only": True}}
 
     def validate_password(self, value):
-        print(f"Validating password: {value}")
+        logger.debug("Validating password.")
         if not isinstance(value, str):
             raise serializers.ValidationError("Password must be a string.")
         if len(value) < 8:
@@ -27,7 +31,7 @@ class UserSerializer(serializers.ModelSerializer):
         return value
 
     def validate_username(self, value):
-        print(f"Validating username: {value}")
+        logger.debug("Validating username: %s", value)
         if not isinstance(value, str):
             raise serializers.ValidationError("Username must be a string.")
         if value.isdigit():
@@ -35,7 +39,7 @@ class UserSerializer(serializers.ModelSerializer):
         return value
 
     def validate_email(self, value):
-        print(f"Validating email: {value}")
+        logger.debug("Validating email: %s", value)
         if not isinstance(value, str):
             raise serializers.ValidationError("Email must be a string.")
         if "@" not in value or "." not in value:
@@ -63,12 +67,19 @@ class UserSerializer(serializers.ModelSerializer):
         return user
 
     def update(self, instance, validated_data):
-        instance.username = validated_data.get("username", instance.username)
-        instance.email = validated_data.get("email", instance.email)
-        instance.is_staff = validated_data.get("is_staff", instance.is_staff)
-        instance.is_active = validated_data.get("is_active", instance.is_active)
+        request = self.context.get("request")
+        if request is None or not request.user.is_staff:
+            validated_data.pop("is_staff", None)
+            validated_data.pop("is_active", None)
+        update_fields = []
+        for field in ["username", "email", "is_staff", "is_active"]:
+            if field in validated_data:
+                setattr(instance, field, validated_data[field])
+                update_fields.append(field)
         password = validated_data.get("password", None)
         if password:
             instance.set_password(password)
-        instance.save()
+            update_fields.append("password")
+        if update_fields:
+            instance.save(update_fields=update_fields)
         return instance
@@ -1,3 +1,247 @@
-from django.test import TestCase
+import json
+from unittest import mock
+from io import StringIO
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.management import CommandError, call_command
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.renderers import JSONRenderer
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, APITestCase
+from .exceptions import api_exception_handler
+from .hashers import TunedArgon2PasswordHasher
+from .renderers import ORJSONRenderer
+from .views import USER_LIST_FIELDS
 
-# Create your tests here.
+
+class UpdateUserTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com", "alicepass1")
+        self.admin = User.objects.create_user(
+            "root", "root@example.com", "rootpass1", is_staff=True
+        )
+
+    def test_non_staff_cannot_raise_own_flags(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            "/api/v1/update-user/",
+            {"user_id": self.user.id, "is_staff": True, "is_active": False},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_staff)
+        self.assertTrue(self.user.is_active)
+
+    def test_non_staff_cannot_update_other_users(self):
+        self.client.force_authenticate(self.user)
+        response = self.client.post(
+            "/api/v1/update-user/",
+            {"user_id": self.admin.id, "password": "takeover123"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.admin.refresh_from_db()
+        self.assertTrue(self.admin.check_password("rootpass1"))
+
+    def test_staff_can_change_flags(self):
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(
+            "/api/v1/update-user/",
+            {"user_id": self.user.id, "is_staff": True},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.is_staff)
+
+
+class GetUsersTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            "root", "root@example.com", "rootpass1", is_staff=True
+        )
+        for i in range(3):
+            User.objects.create_user(f"user{i}", f"user{i}@example.com", "userpass1")
+        self.client.force_authenticate(self.admin)
+
+    def test_page_size_query_param(self):
+        response = self.client.post("/api/v1/get-users/?page_size=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 4)
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertNotIn("password", response.data["results"][0])
+
+
+class DeleteUserTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            "root", "root@example.com", "rootpass1", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+
+    def test_admin_cannot_delete_own_account(self):
+        response = self.client.post(
+            "/api/v1/delete-user/", {"user_id": self.admin.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.data, {"error": "You cannot delete your own account."}
+        )
+        self.assertTrue(User.objects.filter(id=self.admin.id).exists())
+
+
+class FetchUserTokenTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            "root", "root@example.com", "rootpass1", is_staff=True
+        )
+        self.user = User.objects.create_user("alice", "alice@example.com", "alicepass1")
+        self.client.force_authenticate(self.admin)
+
+    def test_returns_existing_token(self):
+        token = Token.objects.create(user=self.user)
+        response = self.client.post(
+            "/api/v1/fetch-user-token/", {"user_id": self.user.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"token": token.key})
+        self.assertEqual(Token.objects.filter(user=self.user).count(), 1)
+
+    def test_creates_missing_token(self):
+        response = self.client.post(
+            "/api/v1/fetch-user-token/", {"user_id": self.user.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {"token": Token.objects.get(user=self.user).key}
+        )
+
+    def test_unknown_user_returns_404(self):
+        response = self.client.post(
+            "/api/v1/fetch-user-token/", {"user_id": 999}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Token.objects.filter(user_id=999).exists())
+
+
+class ExceptionHandlerTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            "root", "root@example.com", "rootpass1", is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+
+    def test_missing_user_id_returns_400(self):
+        for url in [
+            "/api/v1/update-user/",
+            "/api/v1/delete-user/",
+            "/api/v1/fetch-user-token/",
+        ]:
+            response = self.client.post(url, {}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {"error": "user_id is required."})
+
+    def test_non_numeric_user_id_returns_400(self):
+        for url in [
+            "/api/v1/update-user/",
+            "/api/v1/delete-user/",
+            "/api/v1/fetch-user-token/",
+        ]:
+            response = self.client.post(url, {"user_id": "abc"}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertEqual(response.data, {"error": "user_id must be an integer."})
+
+    def test_value_error_is_logged_and_returns_400(self):
+        request = APIRequestFactory().post("/api/v1/get-users/")
+        with self.assertLogs("APIs.exceptions", level="WARNING") as logs:
+            response = api_exception_handler(
+                ValueError("bad"), {"request": request, "view": None}
+            )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+    @override_settings(DEBUG=False)
+    def test_type_error_is_not_mapped_to_400(self):
+        request = APIRequestFactory().post("/api/v1/get-users/")
+        with self.assertLogs("APIs.exceptions", level="ERROR"):
+            response = api_exception_handler(
+                TypeError("bug"), {"request": request, "view": None}
+            )
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @override_settings(DEBUG=False)
+    def test_unhandled_error_is_logged_with_traceback(self):
+        request = APIRequestFactory().post("/api/v1/get-users/")
+        with self.assertLogs("APIs.exceptions", level="ERROR") as logs:
+            response = api_exception_handler(
+                RuntimeError("boom"), {"request": request, "view": None}
+            )
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertIsNotNone(logs.records[0].exc_info)
+
+
+class PasswordHasherTests(APITestCase):
+    def test_new_passwords_use_tuned_argon2(self):
+        hasher = identify_hasher(make_password("longpass123"))
+        self.assertIsInstance(hasher, TunedArgon2PasswordHasher)
+        self.assertEqual(
+            hasher.decode(make_password("longpass123"))["memory_cost"], 19456
+        )
+
+
+class BulkSetPasswordTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("alice", "alice@example.com", "alicepass1")
+
+    def test_refuses_without_debug_or_force(self):
+        with self.assertRaises(CommandError):
+            call_command("bulk_set_password", str(self.user.id))
+
+    @override_settings(DEBUG=True)
+    @mock.patch.dict("os.environ", {"DJANGO_BULK_SET_PASSWORD": "a"})
+    def test_rejects_weak_password(self):
+        with self.assertRaises(CommandError):
+            call_command("bulk_set_password", str(self.user.id))
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("alicepass1"))
+
+    @mock.patch.dict("os.environ", {"DJANGO_BULK_SET_PASSWORD": "Xq7!pLm2vR"})
+    def test_reports_unknown_ids(self):
+        err = StringIO()
+        call_command(
+            "bulk_set_password",
+            str(self.user.id),
+            "999",
+            force=True,
+            stdout=StringIO(),
+            stderr=err,
+        )
+        self.assertIn("999", err.getvalue())
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.check_password("Xq7!pLm2vR"))
+
+
+class ORJSONRendererTests(APITestCase):
+    def setUp(self):
+        User.objects.create_user("alice", "alice@example.com", "alicepass1")
+        self.rows = list(User.objects.values(*USER_LIST_FIELDS))
+
+    def test_matches_json_renderer_for_user_rows(self):
+        self.assertEqual(
+            json.loads(ORJSONRenderer().render(self.rows)),
+            json.loads(JSONRenderer().render(self.rows)),
+        )
+
+    def test_matches_json_renderer_for_int_keys(self):
+        data = {"tags": {0: ["Not a valid string."]}}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_honours_requested_indent(self):
+        renderer = ORJSONRenderer()
+        self.assertNotIn(b"\n", renderer.render(self.rows))
+        self.assertIn(b"\n", renderer.render(self.rows, None, {"indent": 4}))
+        self.assertIn(
+            b"\n", renderer.render(self.rows, "application/json; indent=4", {})
+        )
@@ -3,15 +3,42 @@ from rest_framework import status
 from .serializers import UserSerializer
 from django.contrib.auth.models import User
 from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
 from django.middleware.csrf import get_token
 from rest_framework.authtoken.models import Token
+from rest_framework.pagination import PageNumberPagination
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from django.contrib.auth import authenticate
+from django.db import transaction
 
 
 logger = logging.getLogger(__name__)
 
+USER_LIST_FIELDS = [
+    "id",
+    "username",
+    "email",
+    "date_joined",
+    "is_active",
+    "is_staff",
+]
+
+
+class UserListPagination(PageNumberPagination):
+    page_size = 100
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+def _get_user_id(request):
+    user_id = request.data.get("user_id")
+    if user_id is None:
+        raise ValidationError({"error": "user_id is required."})
+    if isinstance(user_id, bool) or not str(user_id).isdigit():
+        raise ValidationError({"error": "user_id must be an integer."})
+    return int(user_id)
+
 
 @api_view(["POST"])
 @permission_classes([IsAdminUser])
@@ -23,94 +50,88 @@ def get_csrf_token(request):
 @api_view(["POST"])
 @permission_classes([IsAdminUser])
 def get_users(request):
-    try:
-        users = User.objects.all()
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
-    except Exception as e:
-        logger.error("Error fetching users: %s", str(e))
-        return Response(
-            {"error": "An error occurred while fetching users."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+    paginator = UserListPagination()
+    users = paginator.paginate_queryset(
+        User.objects.order_by("id").values(*USER_LIST_FIELDS), request
+    )
+    return paginator.get_paginated_response(users)
 
 
 @api_view(["POST"])
 def create_user(request):
     serializer = UserSerializer(data=request.data)
     if serializer.is_valid():
-        try:
+        with transaction.atomic():
             user = serializer.save()
-            token, created = Token.objects.get_or_create(user=user)
-            return Response(
-                {"user": serializer.data, "token": token.key},
-                status=status.HTTP_201_CREATED,
-            )
-        except Exception as e:
-            logger.error(f"Error creating token: {str(e)}")
-            return Response(
-                {"error": "An error occurred while creating the user token."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            token = Token.objects.create(user=user)
+        return Response(
+            {"user": serializer.data, "token": token.key},
+            status=status.HTTP_201_CREATED,
+        )
     else:
-        logger.error(f"Validation errors: {serializer.errors}")
+        logger.error("Validation errors: %s", serializer.errors)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
 @api_view(["POST"])
 @permission_classes([IsAuthenticated])
 def update_user(request):
-    user_id = request.data.get("user_id")
-    try:
-        user = User.objects.get(id=user_id)
-    except User.DoesNotExist:
-        return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
-
-    serializer = UserSerializer(user, data=request.data, partial=True)
-    if serializer.is_valid():
-        serializer.save()
-        return Response(serializer.data, status=status.HTTP_200_OK)
+    user_id = _get_user_id(request)
+    if user_id == request.user.id:
+        user = request.user
+    elif not request.user.is_staff:
+        return Response(
+            {"error": "You can only update your own account."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
     else:
-        logger.error("Validation errors: %s", serializer.errors)
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            user = User.objects.get(id=user_id)
+        except User.DoesNotExist:
+            return Response(
+                {"error": "User not found."}, status=status.HTTP_404_NOT_FOUND
+            )
+
+    serializer = UserSerializer(
+        user, data=request.data, partial=True, context={"request": request}
+    )
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+    return Response(serializer.data, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
 @permission_classes([IsAdminUser])
 def delete_user(request):
-    user_id = request.data.get("user_id")
-    try:
-        user = User.objects.get(id=user_id)
-        user.delete()
+    user_id = _get_user_id(request)
+    if user_id == request.user.id:
         return Response(
-            {"message": "User deleted successfully."}, status=status.HTTP_200_OK
+            {"error": "You cannot delete your own account."},
+            status=status.HTTP_403_FORBIDDEN,
         )
-    except User.DoesNotExist:
+    deleted, _ = User.objects.filter(id=user_id).delete()
+    if not deleted:
         return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        logger.error("Error deleting user: %s", str(e))
-        return Response(
-            {"error": "An error occurred while deleting the user."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+    return Response(
+        {"message": "User deleted successfully."}, status=status.HTTP_200_OK
+    )
 
 
 @api_view(["POST"])
 @permission_classes([IsAdminUser])
 def fetch_user_token(request):
-    user_id = request.data.get("user_id")
-    try:
-        user = User.objects.get(id=user_id)
+    user_id = _get_user_id(request)
+    key = Token.objects.filter(user_id=user_id).values_list("key", flat=True).first()
+    if key is None:
+        try:
+            user = User.objects.only("id").get(id=user_id)
+        except User.DoesNotExist:
+            return Response(
+                {"error": "User not found."}, status=status.HTTP_404_NOT_FOUND
+            )
         token, created = Token.objects.get_or_create(user=user)
-        return Response({"token": token.key}, status=status.HTTP_200_OK)
-    except User.DoesNotExist:
-        return Response({"error": "User not found."}, status=status.HTTP_404_NOT_FOUND)
-    except Exception as e:
-        logger.error("Error fetching token: %s", str(e))
-        return Response(
-            {"error": "An error occurred while fetching the token."},
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+        key = token.key
+    return Response({"token": key}, status=status.HTTP_200_OK)
 
 
 @api_view(["POST"])
@@ -127,7 +148,7 @@ def login_user(request):
     # Use authenticate to verify the username and password
     user = authenticate(username=username, password=password)
     if user is not None:
-        logger.info(f"User {username} logged in successfully.")
+        logger.info("User %s logged in successfully.", username)
         return Response(
             {
                 "username": user.username,
@@ -136,7 +157,7 @@ def login_user(request):
             status=status.HTTP_200_OK,
         )
     else:
-        logger.warning(f"Invalid login attempt for user {username}.")
+        logger.warning("Invalid login attempt for user %s.", username)
     
     return Response(
         {"error": "Invalid username or password."},